@@ -1,64 +1,181 @@
 import streamlit as st
 import os
 import requests
-import pandas as pd
 import logging
 import time
 import re
+import csv
+import hashlib
+import ipaddress
+import asyncio
+import atexit
+import queue
+import threading
 from datetime import datetime
-from typing import Optional, List, Tuple, Dict
-from dotenv import load_dotenv
+from functools import lru_cache
+from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Optional, List, Tuple, Dict, Iterator
 from io import StringIO
-import validators
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('app.log'),
-        logging.StreamHandler()
-    ]
-)
+from logging.handlers import QueueHandler, QueueListener
+import orjson
+import httpx
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    import pandas as pd  # Imported lazily at runtime to keep cold start fast
+
+# Configure logging once; Streamlit re-executes this module on every rerun
+if not logging.getLogger().handlers:
+    # File writes happen on a background thread; the request path only enqueues
+    _log_queue = queue.Queue(-1)
+    _log_listener = QueueListener(_log_queue, logging.FileHandler('app.log'))
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            QueueHandler(_log_queue),
+            logging.StreamHandler()
+        ]
+    )
 logger = logging.getLogger(__name__)
 
+# Markdown table rows (outer pipes optional, as GFM allows) and |---|:---:| separator lines
+_ROW_RE = re.compile(r"^[ \t]*\|?([^\n|]*\|[^\n]*?)\|?[ \t]*$", re.M)
+_SEP_RE = re.compile(r"^[ \t]*\|?[ \t:\-|]+\|?[ \t]*$", re.M)
+# Markdown links used as source citations: [name](https://...)
+_CITATION_RE = re.compile(r"\[([^\]]+)\]\((https?://[^)]+)\)")
+# Sanity check for http(s) URLs with a dotted (IDNA-encoded) hostname; xn-- covers IDN TLDs
+_URL_RE = re.compile(
+    r"https?://(?:[A-Za-z0-9-]+\.)+(?:[A-Za-z]{2,}|xn--[A-Za-z0-9-]+)(:\d+)?([/?#].*)?"
+)
+
+@st.cache_resource
+def _load_env():
+    """Load .env once per process instead of on every rerun"""
+    from dotenv import load_dotenv
+    load_dotenv()
+
 class Config:
     """Configuration management"""
     def __init__(self):
-        load_dotenv()
+        _load_env()
         self.api_key = os.getenv("OPENROUTER_API_KEY")
         self.rate_limit_delay = float(os.getenv("RATE_LIMIT_DELAY", "2"))
         self.max_retries = int(os.getenv("MAX_RETRIES", "3"))
+        self.max_tokens = int(os.getenv("MAX_TOKENS", "800"))
         self.default_model = "perplexity/llama-3-sonar-large-online"
 
+# Start backing off once fewer requests than this remain in the window
+RATE_LIMIT_REMAINING_THRESHOLD = 2
+
+def _completion_payload(model: str, prompt: str, max_tokens: int = 800, stream: bool = False) -> Dict:
+    """Build the chat completion request body"""
+    if model.startswith("anthropic/"):
+        # Anthropic needs an explicit breakpoint to cache the stable system prompt
+        system_content = [{
+            "type": "text",
+            "text": _STABLE_SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"}
+        }]
+    else:
+        # Other providers cache identical prompt prefixes automatically
+        system_content = _STABLE_SYSTEM_PROMPT
+    data = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": system_content},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.1,
+        "max_tokens": max_tokens
+    }
+    if stream:
+        data["stream"] = True
+    return data
+
+def _throttle_delay(status_code: int, headers, attempt: int, rate_limit_delay: float) -> Optional[float]:
+    """Seconds to hold off the next request, or None if not throttled"""
+    remaining = headers.get("X-RateLimit-Remaining")
+    throttled = status_code == 429
+    if not throttled and remaining is not None:
+        try:
+            throttled = int(remaining) < RATE_LIMIT_REMAINING_THRESHOLD
+        except ValueError:
+            pass
+    if not throttled:
+        return None
+    
+    # Without Retry-After, back off linearly on 429 and by the configured delay otherwise
+    fallback_delay = (attempt + 1) * 5 if status_code == 429 else rate_limit_delay
+    try:
+        return float(headers.get("Retry-After", fallback_delay))
+    except ValueError:  # HTTP-date form
+        return fallback_delay
+
 class OpenRouterClient:
     """OpenRouter API client with error handling and rate limiting"""
     
-    def __init__(self, api_key: str, rate_limit_delay: float = 2):
+    def __init__(self, api_key: str, rate_limit_delay: float = 2, max_tokens: int = 800):
         self.api_key = api_key
         self.rate_limit_delay = rate_limit_delay
-        self.last_request_time = 0
+        self.max_tokens = max_tokens
+        self._earliest_next_ts = 0.0
+        self._throttle_lock = threading.Lock()
+        self._session = self._create_session()
+    
+    def _create_session(self) -> requests.Session:
+        """Create a pooled session so repeated calls reuse keep-alive connections"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=50,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        session.mount("https://", adapter)
+        session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+        return session
         
     def _wait_for_rate_limit(self):
-        """Implement rate limiting"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self.last_request_time = time.time()
+        """Wait only if the provider has asked us to back off"""
+        delay = self._earliest_next_ts - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+    
+    def _update_rate_limit(self, response: requests.Response, attempt: int = 0):
+        """Schedule the next request from Retry-After / X-RateLimit-Remaining headers"""
+        delay = _throttle_delay(response.status_code, response.headers, attempt, self.rate_limit_delay)
+        if delay is None:
+            return
+        with self._throttle_lock:
+            self._earliest_next_ts = max(self._earliest_next_ts, time.monotonic() + delay)
+    
+    def _fetch_models(self) -> List[str]:
+        """Fetch web-enabled model ids from OpenRouter, raising on failure"""
+        self._wait_for_rate_limit()
+        resp = self._session.get(
+            "https://openrouter.ai/api/v1/models",
+            timeout=10
+        )
+        self._update_rate_limit(resp)
+        resp.raise_for_status()
+        models = orjson.loads(resp.content)["data"]
+        return [model["id"] for model in models 
+               if "perplexity" in model["id"].lower() or "online" in model["id"].lower()]
     
     def get_available_models(self) -> List[str]:
-        """Get available models from OpenRouter"""
+        """Get available models from OpenRouter (shared cache across sessions)"""
         try:
-            self._wait_for_rate_limit()
-            resp = requests.get(
-                "https://openrouter.ai/api/v1/models",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                timeout=10
-            )
-            resp.raise_for_status()
-            models = resp.json()["data"]
-            return [model["id"] for model in models 
-                   if "perplexity" in model["id"].lower() or "online" in model["id"].lower()]
+            return fetch_models(hash_key(self.api_key), self)
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching models: {e}")
             return []
@@ -66,85 +183,171 @@ class OpenRouterClient:
             logger.error(f"Unexpected error fetching models: {e}")
             return []
     
+    def stream_model(self, model: str, prompt: str, max_retries: int = 3) -> Iterator[str]:
+        """Stream OpenRouter completion tokens with retry logic
+        
+        Raises RuntimeError if the connection drops after output has started,
+        so a truncated answer is never mistaken for a complete one.
+        """
+        url = "https://openrouter.ai/api/v1/chat/completions"
+        data = _completion_payload(model, prompt, self.max_tokens, stream=True)
+        
+        for attempt in range(max_retries):
+            streamed = False
+            try:
+                self._wait_for_rate_limit()
+                with self._session.post(url, data=orjson.dumps(data), stream=True, timeout=30) as response:
+                    self._update_rate_limit(response, attempt)
+                    if response.status_code == 200:
+                        for line in response.iter_lines():
+                            # Skip keep-alive comments and blank SSE separators
+                            if not line.startswith(b"data: "):
+                                continue
+                            payload = line[6:]
+                            if payload == b"[DONE]":
+                                break
+                            chunk = orjson.loads(payload)
+                            content = chunk["choices"][0].get("delta", {}).get("content")
+                            if content:
+                                streamed = True
+                                yield content
+                        logger.info(f"Successful API call on attempt {attempt + 1}")
+                        return
+                    elif response.status_code == 429:  # Rate limited, next attempt waits
+                        logger.warning(f"Rate limited on attempt {attempt + 1}, backing off...")
+                    else:
+                        logger.error(f"API error {response.status_code}: {response.text}")
+                    
+            except requests.exceptions.Timeout as e:
+                logger.warning(f"Request timeout on attempt {attempt + 1}")
+                if streamed:
+                    # Partial output already delivered; retrying would duplicate it
+                    raise RuntimeError("Response stream timed out mid-answer") from e
+                if attempt < max_retries - 1:
+                    time.sleep(2 ** attempt)  # Exponential backoff
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Request error on attempt {attempt + 1}: {e}")
+                if streamed:
+                    raise RuntimeError("Response stream interrupted mid-answer") from e
+                if attempt < max_retries - 1:
+                    time.sleep(2 ** attempt)
+    
     def query_model(self, model: str, prompt: str, max_retries: int = 3) -> Optional[str]:
+        """Query OpenRouter and return the full completion text"""
+        result = "".join(self.stream_model(model, prompt, max_retries))
+        return result or None
+
+class AsyncOpenRouterClient:
+    """Async OpenRouter client for concurrent bulk lookups over HTTP/2"""
+    
+    def __init__(self, api_key: str, rate_limit_delay: float = 2, max_inflight: int = 8,
+                 max_tokens: int = 800):
+        self.rate_limit_delay = rate_limit_delay
+        self.max_tokens = max_tokens
+        self._inflight = asyncio.Semaphore(max_inflight)
+        self._earliest_next_ts = 0.0
+        self._client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=30,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json"
+            }
+        )
+    
+    async def _wait_for_rate_limit(self):
+        """Wait only if the provider has asked us to back off"""
+        delay = self._earliest_next_ts - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def _update_rate_limit(self, response: httpx.Response, attempt: int = 0):
+        """Schedule the next request from Retry-After / X-RateLimit-Remaining headers"""
+        delay = _throttle_delay(response.status_code, response.headers, attempt, self.rate_limit_delay)
+        if delay is not None:
+            self._earliest_next_ts = max(self._earliest_next_ts, time.monotonic() + delay)
+    
+    async def query_model(self, model: str, prompt: str, max_retries: int = 3) -> Optional[str]:
         """Query OpenRouter with retry logic"""
         url = "https://openrouter.ai/api/v1/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        data = {
-            "model": model,
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": 0.1,
-            "max_tokens": 2000
-        }
+        content = orjson.dumps(_completion_payload(model, prompt, self.max_tokens))
         
         for attempt in range(max_retries):
             try:
-                self._wait_for_rate_limit()
-                response = requests.post(url, headers=headers, json=data, timeout=30)
+                await self._wait_for_rate_limit()
+                async with self._inflight:
+                    response = await self._client.post(url, content=content)
+                self._update_rate_limit(response, attempt)
                 
                 if response.status_code == 200:
-                    result = response.json()["choices"][0]["message"]["content"]
+                    result = orjson.loads(response.content)["choices"][0]["message"]["content"]
                     logger.info(f"Successful API call on attempt {attempt + 1}")
                     return result
-                elif response.status_code == 429:  # Rate limited
-                    wait_time = (attempt + 1) * 5
-                    logger.warning(f"Rate limited, waiting {wait_time} seconds...")
-                    time.sleep(wait_time)
+                elif response.status_code == 429:  # Rate limited, next attempt waits
+                    logger.warning(f"Rate limited on attempt {attempt + 1}, backing off...")
                 else:
                     logger.error(f"API error {response.status_code}: {response.text}")
                     
-            except requests.exceptions.Timeout:
+            except httpx.TimeoutException:
                 logger.warning(f"Request timeout on attempt {attempt + 1}")
                 if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-            except requests.exceptions.RequestException as e:
+                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+            except httpx.HTTPError as e:
                 logger.error(f"Request error on attempt {attempt + 1}: {e}")
                 if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
+                    await asyncio.sleep(2 ** attempt)
         
         return None
+    
+    async def aclose(self):
+        """Close pooled connections"""
+        await self._client.aclose()
 
-class DataProcessor:
-    """Data processing utilities"""
+# Hash long AI responses cheaply when keying the parse caches
+_TEXT_HASH_FUNCS = {str: lambda s: hashlib.blake2b(s.encode(), digest_size=8).digest()}
+
+@st.cache_data(max_entries=32, show_spinner=False, hash_funcs=_TEXT_HASH_FUNCS)
+def parse_markdown_table(text: str) -> Optional["pd.DataFrame"]:
+    """Parse markdown table from AI response"""
+    import pandas as pd
     
-    @staticmethod
-    def parse_markdown_table(text: str) -> Optional[pd.DataFrame]:
-        """Parse markdown table from AI response"""
-        try:
-            lines = text.split("\n")
-            table_lines = [line for line in lines if "|" in line and "---" not in line]
-            
-            if len(table_lines) < 2:
-                return None
-                
-            # Extract headers
-            headers = [cell.strip() for cell in table_lines[0].split("|") if cell.strip()]
-            if not headers:
-                return None
-            
-            # Extract rows
-            rows = []
-            for line in table_lines[1:]:
-                row = [cell.strip() for cell in line.split("|") if cell.strip()]
-                if len(row) == len(headers):  # Only include complete rows
-                    rows.append(row)
-            
-            if not rows:
-                return None
-                
-            return pd.DataFrame(rows, columns=headers)
-        except Exception as e:
-            logger.error(f"Error parsing markdown table: {e}")
+    try:
+        rows = _ROW_RE.findall(_SEP_RE.sub("", text))
+        
+        if len(rows) < 2:
             return None
-    
-    @staticmethod
-    def extract_citations(text: str) -> List[Tuple[str, str]]:
-        """Extract citations from text"""
-        pattern = r"\[([^\]]+)\]\((https?://[^\)]+)\)"
-        return re.findall(pattern, text)
+        
+        # Let the C parser split cells; rows with extra cells are skipped
+        df = pd.read_csv(
+            StringIO("\n".join(rows)),
+            sep="|",
+            header=0,
+            engine="c",
+            dtype=str,
+            index_col=False,
+            skipinitialspace=True,
+            quoting=csv.QUOTE_NONE,
+            on_bad_lines="skip"
+        )
+        df.columns = df.columns.str.strip()
+        df = df.fillna("").apply(lambda col: col.str.strip())
+        
+        if df.empty:
+            return None
+            
+        return df
+    except Exception as e:
+        logger.error(f"Error parsing markdown table: {e}")
+        return None
+
+@st.cache_data(max_entries=32, show_spinner=False, hash_funcs=_TEXT_HASH_FUNCS)
+def extract_citations(text: str) -> List[Tuple[str, str]]:
+    """Extract citations from text"""
+    return _CITATION_RE.findall(text)
+
+class DataProcessor:
+    """Data processing utilities"""
     
     @staticmethod
     def validate_company_data(company: str, website: str, country: str) -> Tuple[bool, str]:
@@ -159,7 +362,7 @@ class DataProcessor:
         if not website.startswith(('http://', 'https://')):
             website = 'https://' + website
             
-        if not validators.url(website):
+        if not _is_website_url(website):
             return False, "Invalid website URL format"
         
         if not country or len(country.strip()) < 2:
@@ -167,14 +370,88 @@ class DataProcessor:
             
         return True, ""
 
-def create_search_prompt(company: str, website: str, country: str) -> str:
-    """Create optimized search prompt"""
-    domain = website.replace("https://", "").replace("http://", "").replace("www.", "").split("/")[0]
+def _is_website_url(website: str) -> bool:
+    """Check for an http(s) URL with a dotted domain (IDNs included) or an IP address host"""
+    # urlparse silently deletes tabs and newlines, so they must be rejected up front
+    if any(ch in website for ch in "\t\r\n"):
+        return False
+    parsed = urlparse(website)
+    if parsed.scheme not in {"http", "https"} or not parsed.hostname:
+        return False
+    try:
+        ipaddress.ip_address(parsed.hostname)
+        return True
+    except ValueError:
+        pass
+    try:
+        # Punycode non-ASCII labels so the ASCII-only pattern accepts e.g. münchen.de
+        ascii_netloc = parsed.netloc.encode("idna").decode("ascii")
+    except UnicodeError:
+        return False
+    return bool(_URL_RE.fullmatch(parsed._replace(netloc=ascii_netloc).geturl()))
+
+def hash_key(api_key: str) -> str:
+    """Hash the API key so cache keys never contain the secret"""
+    return hashlib.blake2b(api_key.encode()).hexdigest()[:16]
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def get_client(api_key_hash: str, rate_limit_delay: float, max_tokens: int,
+               _api_key: str) -> OpenRouterClient:
+    """Share one pooled client per key and settings across reruns, so keep-alive
+    connections and Retry-After backoff survive between lookups"""
+    return OpenRouterClient(_api_key, rate_limit_delay, max_tokens)
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def fetch_models(api_key_hash: str, _client: OpenRouterClient) -> List[str]:
+    """Fetch the model list once per key per hour; errors are not cached"""
+    return _client._fetch_models()
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def cached_response(api_key_hash: str, model: str, prompt: str, _result: Optional[str] = None) -> str:
+    """Complete responses cached per (key, model, prompt)
+    
+    Call without ``_result`` to look one up (LookupError on a miss, which is
+    not cached), and with it to store a response that finished streaming.
+    """
+    if _result is None:
+        raise LookupError("No cached response")
+    return _result
+
+def bulk_lookup(api_key: str, rate_limit_delay: float, model: str, rows: "pd.DataFrame",
+                max_retries: int = 3, max_inflight: int = 8,
+                max_tokens: int = 800) -> Optional["pd.DataFrame"]:
+    """Run concurrent lookups for every company row and combine the tables"""
+    import pandas as pd
+    
+    prompts = [create_search_prompt(row.company, row.website, row.country)
+               for row in rows.itertuples(index=False)]
+    
+    async def run_all() -> List[Optional[str]]:
+        # The client must be created inside the running event loop
+        client = AsyncOpenRouterClient(api_key, rate_limit_delay, max_inflight, max_tokens)
+        try:
+            return await asyncio.gather(*[client.query_model(model, p, max_retries) for p in prompts])
+        finally:
+            await client.aclose()
     
-    return f"""
+    results = asyncio.run(run_all())
+    
+    frames = []
+    for company, result in zip(rows["company"], results):
+        df = parse_markdown_table(result) if result else None
+        if df is not None and not df.empty:
+            df.insert(0, "Company", company)
+            frames.append(df)
+    
+    if not frames:
+        return None
+    return pd.concat(frames, ignore_index=True)
+
+# Identical for every lookup so providers can reuse the cached prefix
+_STABLE_SYSTEM_PROMPT = """
 You are a professional business research assistant with web browsing capabilities.
 
-**TASK**: Find verified contact information for key executives at {company} (website: {website}), located in {country}.
+**TASK**: Find verified contact information for key executives at the company described by the user.
 
 **SEARCH STRATEGY**:
 1. Check the company's official website team/about pages
@@ -198,12 +475,12 @@ You are a professional business research assistant with web browsing capabilitie
 
 **EXAMPLE OUTPUT**:
 | Name | Role | LinkedIn URL | Email | General Company Contact |
-|------|------|--------------|-------|-------|------------------------|
-| Jane Smith | CEO | https://www.linkedin.com/in/janesmith | j.smith@{domain} | | info@{domain} |
-| John Doe | CTO | https://www.linkedin.com/in/johndoe | john.doe@{domain}| | |
+|------|------|--------------|-------|-------------------------|
+| Jane Smith | CEO | https://www.linkedin.com/in/janesmith | j.smith@acme.com | info@acme.com |
+| John Doe | CTO | https://www.linkedin.com/in/johndoe | john.doe@acme.com | |
 
 **Sources:**
-- [Company Team Page](https://{domain}/team)
+- [Company Team Page](https://acme.com/team)
 - [LinkedIn: Jane Smith](https://www.linkedin.com/in/janesmith)
 
 **IMPORTANT**: 
@@ -211,10 +488,30 @@ You are a professional business research assistant with web browsing capabilitie
 - Verify current employment status
 - Prioritize recent and authoritative sources
 - If no contacts found, explain your search process
+"""
+
+_PROMPT_TEMPLATE = """
+Find verified contact information for key executives at {company} (website: {website}), located in {country}.
+The company email domain is likely {domain}.
 
 Begin your research now for {company}.
 """
 
+def _strip_domain(website: str) -> str:
+    """Extract the bare domain (without www.) from a website URL"""
+    parsed = urlparse(website if "://" in website else f"//{website}")
+    return parsed.netloc.removeprefix("www.")
+
+@lru_cache(maxsize=128)
+def create_search_prompt(company: str, website: str, country: str) -> str:
+    """Create optimized search prompt"""
+    return _PROMPT_TEMPLATE.format(
+        company=company,
+        website=website,
+        country=country,
+        domain=_strip_domain(website)
+    )
+
 def main():
     # App configuration
     st.set_page_config(
@@ -248,11 +545,16 @@ def main():
         
         # Advanced settings
         with st.expander("Advanced Settings"):
-            rate_limit = st.slider("Rate Limit (seconds)", 1, 10, int(config.rate_limit_delay))
+            rate_limit = st.slider("Rate Limit (seconds)", 1, 10, int(config.rate_limit_delay),
+                                   help="Backoff used when OpenRouter signals throttling without Retry-After")
             max_retries = st.slider("Max Retries", 1, 5, config.max_retries)
+            bypass_cache = st.checkbox("Bypass cache", value=False,
+                                       help="Clear cached responses and query the model live")
+            if st.button("🔄 Refresh models"):
+                fetch_models.clear()
     
     # Initialize client
-    client = OpenRouterClient(api_key, rate_limit)
+    client = get_client(hash_key(api_key), rate_limit, config.max_tokens, api_key)
     
     # Get available models
     with st.spinner("Loading available models..."):
@@ -337,7 +639,25 @@ def main():
             progress_bar.progress(50)
             status_text.text("🌐 Searching the web for contacts...")
             
-            result = client.query_model(model, prompt, max_retries)
+            st.header("📋 Research Results")
+            
+            with st.expander("📄 Full AI Response", expanded=True):
+                api_key_hash = hash_key(api_key)
+                if bypass_cache:
+                    # Drop cached responses and query the model live
+                    cached_response.clear()
+                try:
+                    result = cached_response(api_key_hash, model, prompt)
+                    st.markdown(result)
+                except LookupError:
+                    # Cache miss: stream raw results as they arrive, then keep the full answer
+                    try:
+                        result = st.write_stream(client.stream_model(model, prompt, max_retries))
+                    except RuntimeError as e:
+                        logger.warning(f"Streaming query failed: {e}")
+                        result = None
+                    if result:
+                        cached_response(api_key_hash, model, prompt, _result=result)
             
             progress_bar.progress(75)
             status_text.text("📊 Processing results...")
@@ -350,27 +670,23 @@ def main():
             progress_bar.progress(100)
             status_text.text("✅ Search completed!")
             
-            st.header("📋 Research Results")
-            
-            # Show raw results
-            with st.expander("📄 Full AI Response", expanded=True):
-                st.markdown(result)
-            
             # Parse and display structured data
-            df = DataProcessor.parse_markdown_table(result)
+            df = parse_markdown_table(result)
             
             if df is not None and not df.empty:
                 st.subheader("📊 Structured Data")
                 st.dataframe(df, use_container_width=True)
                 
-                # Export options
+                # Export options, serialized once for both widgets
+                csv_buffer = StringIO()
+                df.to_csv(csv_buffer, index=False)
+                csv_text = csv_buffer.getvalue()
                 col1, col2, col3 = st.columns(3)
                 
                 with col1:
-                    csv_data = df.to_csv(index=False).encode("utf-8")
                     st.download_button(
                         "⬇️ Download CSV",
-                        data=csv_data,
+                        data=csv_text.encode("utf-8"),
                         file_name=f"{company.lower().replace(' ', '_')}_contacts_{datetime.now().strftime('%Y%m%d')}.csv",
                         mime="text/csv"
                     )
@@ -379,13 +695,13 @@ def main():
                     # Copy to clipboard functionality
                     st.text_area(
                         "📋 Copy Data",
-                        df.to_csv(index=False),
+                        csv_text,
                         height=150,
                         help="Select all and copy to clipboard"
                     )
             
             # Show citations
-            citations = DataProcessor.extract_citations(result)
+            citations = extract_citations(result)
             if citations:
                 st.subheader("📚 Sources & References")
                 for i, (name, url) in enumerate(citations, 1):
@@ -401,6 +717,51 @@ def main():
             progress_bar.empty()
             status_text.empty()
     
+    # Bulk lookup
+    st.header("📂 Bulk Company Research")
+    uploaded_file = st.file_uploader(
+        "Upload CSV with columns: company, website, country",
+        type="csv",
+        help="Each row is researched concurrently and combined into one export"
+    )
+    
+    if uploaded_file is not None and st.button("🚀 Run Bulk Lookup"):
+        import pandas as pd
+        
+        rows = pd.read_csv(uploaded_file, dtype=str).fillna("")
+        rows.columns = [col.strip().lower() for col in rows.columns]
+        missing = {"company", "website", "country"} - set(rows.columns)
+        if missing:
+            st.error(f"❌ Missing CSV columns: {', '.join(sorted(missing))}")
+            return
+        
+        # Skip rows that fail validation
+        valid_mask = [DataProcessor.validate_company_data(row.company, row.website, row.country)[0]
+                      for row in rows.itertuples(index=False)]
+        skipped = len(rows) - sum(valid_mask)
+        rows = rows[valid_mask]
+        if skipped:
+            st.warning(f"⚠️ Skipped {skipped} rows with invalid company data")
+        if rows.empty:
+            st.error("❌ No valid rows to research")
+            return
+        
+        with st.spinner(f"Researching {len(rows)} companies..."):
+            bulk_df = bulk_lookup(api_key, rate_limit, model, rows, max_retries,
+                                  max_tokens=config.max_tokens)
+        
+        if bulk_df is None:
+            st.error("❌ No structured results returned for the uploaded companies.")
+        else:
+            st.subheader("📊 Bulk Results")
+            st.dataframe(bulk_df, use_container_width=True)
+            st.download_button(
+                "⬇️ Download Bulk CSV",
+                data=bulk_df.to_csv(index=False).encode("utf-8"),
+                file_name=f"bulk_contacts_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv"
+            )
+    
     # Footer
     st.markdown("---")
     col1, col2, col3 = st.columns(3)
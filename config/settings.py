@@ -1,196 +1,289 @@
 """
 Configuration management for Email Finder Pro
 """
+import functools
+import logging
 import os
-from typing import Dict, Any, Optional
+import re
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+logger = logging.getLogger(__name__)
 
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
+
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Centralized configuration management"""
-    
+
     # API Configuration
-    OPENROUTER_API_KEY: str = os.getenv("OPENROUTER_API_KEY", "")
+    OPENROUTER_API_KEY: str = ""
     OPENROUTER_BASE_URL: str = "https://openrouter.ai/api/v1"
     DEFAULT_MODEL: str = "perplexity/llama-3-sonar-large-online"
-    
+
     # Rate Limiting
-    RATE_LIMIT_DELAY: float = float(os.getenv("RATE_LIMIT_DELAY", "2.0"))
-    MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
-    REQUEST_TIMEOUT: int = int(os.getenv("REQUEST_TIMEOUT", "30"))
-    
+    RATE_LIMIT_DELAY: float = 2.0
+    MAX_RETRIES: int = 3
+    REQUEST_TIMEOUT: int = 30
+
     # Scraping Configuration
-    SELENIUM_TIMEOUT: int = int(os.getenv("SELENIUM_TIMEOUT", "10"))
-    PAGE_LOAD_DELAY: float = float(os.getenv("PAGE_LOAD_DELAY", "2.0"))
-    MAX_EMAILS_PER_SITE: int = int(os.getenv("MAX_EMAILS_PER_SITE", "100"))
-    
+    BROWSER_BACKEND: str = "selenium"  # or "playwright"
+    SELENIUM_TIMEOUT: int = 10
+    PAGE_LOAD_DELAY: float = 2.0
+    MAX_EMAILS_PER_SITE: int = 100
+
     # Email Validation
-    EXCLUDED_DOMAINS: set = {
+    EXCLUDED_DOMAINS: frozenset[str] = frozenset({
         "example.com", "test.com", "domain.com", "yoursite.com",
         "sentry.io", "google.com", "facebook.com", "twitter.com",
         "linkedin.com", "instagram.com", "youtube.com", "wordpress.com",
         "github.com", "stackoverflow.com", "reddit.com"
-    }
-    
+    })
+
     # User Agent for requests
-    USER_AGENT: str = os.getenv(
-        "USER_AGENT",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
-    )
-    
+    USER_AGENT: str = DEFAULT_USER_AGENT
+
     # Logging Configuration
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
-    LOG_FILE: str = os.getenv("LOG_FILE", "app.log")
-    
+    LOG_LEVEL: str = "INFO"
+    LOG_FILE: str = "app.log"
+
     # Feature Flags
-    ENABLE_SITEMAP_SEARCH: bool = os.getenv("ENABLE_SITEMAP_SEARCH", "true").lower() == "true"
-    ENABLE_DEEP_SEARCH: bool = os.getenv("ENABLE_DEEP_SEARCH", "true").lower() == "true"
-    ENABLE_EMAIL_CATEGORIZATION: bool = os.getenv("ENABLE_EMAIL_CATEGORIZATION", "true").lower() == "true"
-    
+    ENABLE_SITEMAP_SEARCH: bool = True
+    ENABLE_SITEMAP_CACHE: bool = True
+    ENABLE_DEEP_SEARCH: bool = True
+    ENABLE_EMAIL_CATEGORIZATION: bool = True
+    STRICT_EMAIL_VALIDATION: bool = False
+
     # Security Settings
-    RESTRICT_PRIVATE_IPS: bool = os.getenv("RESTRICT_PRIVATE_IPS", "true").lower() == "true"
-    MAX_URL_LENGTH: int = int(os.getenv("MAX_URL_LENGTH", "2048"))
-    
-    @classmethod
-    def get_chrome_options(cls) -> Dict[str, Any]:
-        """Get Chrome options for Selenium"""
-        return {
+    RESTRICT_PRIVATE_IPS: bool = True
+    MAX_URL_LENGTH: int = 2048
+
+    # Built once from USER_AGENT; read-only so callers can't mutate shared state
+    _chrome_options: Mapping[str, Any] = field(init=False, repr=False, compare=False)
+    _request_headers: Mapping[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_chrome_options", MappingProxyType({
             "headless": True,
             "disable_gpu": True,
             "no_sandbox": True,
             "disable_dev_shm_usage": True,
             "disable_blink_features": "AutomationControlled",
-            "user_agent": cls.USER_AGENT,
+            "user_agent": self.USER_AGENT,
             "window_size": "1920,1080"
-        }
-    
-    @classmethod
-    def get_request_headers(cls) -> Dict[str, str]:
-        """Get standard request headers"""
-        return {
-            "User-Agent": cls.USER_AGENT,
+        }))
+        object.__setattr__(self, "_request_headers", MappingProxyType({
+            "User-Agent": self.USER_AGENT,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
             "Accept-Encoding": "gzip, deflate",
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1"
-        }
-    
+        }))
+
     @classmethod
-    def validate_config(cls) -> tuple[bool, list[str]]:
+    def from_env(cls) -> "AppConfig":
+        """Load .env (once) and snapshot the environment into a config"""
+        if not os.environ.get("DOTENV_LOADED"):
+            load_dotenv(override=False)
+            os.environ["DOTENV_LOADED"] = "1"
+
+        env = os.environ.copy()
+
+        def flag(key: str, default: str = "true") -> bool:
+            return env.get(key, default).lower() == "true"
+
+        return cls(
+            OPENROUTER_API_KEY=env.get("OPENROUTER_API_KEY", ""),
+            RATE_LIMIT_DELAY=float(env.get("RATE_LIMIT_DELAY", "2.0")),
+            MAX_RETRIES=int(env.get("MAX_RETRIES", "3")),
+            REQUEST_TIMEOUT=int(env.get("REQUEST_TIMEOUT", "30")),
+            BROWSER_BACKEND=env.get("BROWSER_BACKEND", "selenium").lower(),
+            SELENIUM_TIMEOUT=int(env.get("SELENIUM_TIMEOUT", "10")),
+            PAGE_LOAD_DELAY=float(env.get("PAGE_LOAD_DELAY", "2.0")),
+            MAX_EMAILS_PER_SITE=int(env.get("MAX_EMAILS_PER_SITE", "100")),
+            USER_AGENT=env.get("USER_AGENT", DEFAULT_USER_AGENT),
+            LOG_LEVEL=env.get("LOG_LEVEL", "INFO"),
+            LOG_FILE=env.get("LOG_FILE", "app.log"),
+            ENABLE_SITEMAP_SEARCH=flag("ENABLE_SITEMAP_SEARCH"),
+            ENABLE_SITEMAP_CACHE=flag("ENABLE_SITEMAP_CACHE"),
+            ENABLE_DEEP_SEARCH=flag("ENABLE_DEEP_SEARCH"),
+            ENABLE_EMAIL_CATEGORIZATION=flag("ENABLE_EMAIL_CATEGORIZATION"),
+            STRICT_EMAIL_VALIDATION=flag("STRICT_EMAIL_VALIDATION", "false"),
+            RESTRICT_PRIVATE_IPS=flag("RESTRICT_PRIVATE_IPS"),
+            MAX_URL_LENGTH=int(env.get("MAX_URL_LENGTH", "2048"))
+        )
+
+    def get_chrome_options(self) -> Mapping[str, Any]:
+        """Get Chrome options for Selenium (read-only, use dict() to modify)"""
+        return self._chrome_options
+
+    def get_request_headers(self) -> Mapping[str, str]:
+        """Get standard request headers (read-only, use dict() to modify)"""
+        return self._request_headers
+
+    def validate_config(self) -> tuple[bool, list[str]]:
         """Validate configuration and return any errors"""
         errors = []
-        
-        if not cls.OPENROUTER_API_KEY:
+
+        if not self.OPENROUTER_API_KEY:
             errors.append("OPENROUTER_API_KEY is required")
-        
-        if cls.RATE_LIMIT_DELAY < 0:
+
+        if self.RATE_LIMIT_DELAY < 0:
             errors.append("RATE_LIMIT_DELAY must be >= 0")
-        
-        if cls.MAX_RETRIES < 1:
+
+        if self.MAX_RETRIES < 1:
             errors.append("MAX_RETRIES must be >= 1")
-        
-        if cls.REQUEST_TIMEOUT < 1:
+
+        if self.REQUEST_TIMEOUT < 1:
             errors.append("REQUEST_TIMEOUT must be >= 1")
-        
+
+        if self.BROWSER_BACKEND not in ("selenium", "playwright"):
+            errors.append("BROWSER_BACKEND must be 'selenium' or 'playwright'")
+
         return len(errors) == 0, errors
 
+# Common fake email patterns to exclude
+_FAKE_PATTERNS = (
+    r'noreply', r'no-reply', r'donotreply', r'test@',
+    r'admin@example', r'user@example', r'contact@example',
+    r'webmaster@example', r'info@example', r'@example\.com',
+    r'sample@', r'demo@', r'placeholder@'
+)
+
+# Email categorization patterns
+_CATEGORY_PATTERNS = {
+    'sales': (
+        r'sales', r'business', r'commercial', r'revenue',
+        r'partnerships', r'enterprise', r'accounts'
+    ),
+    'support': (
+        r'support', r'help', r'service', r'assistance',
+        r'helpdesk', r'care', r'ticket'
+    ),
+    'info': (
+        r'info', r'contact', r'hello', r'general',
+        r'inquiry', r'questions'
+    ),
+    'admin': (
+        r'admin', r'webmaster', r'postmaster', r'system',
+        r'technical', r'it', r'tech'
+    ),
+    'marketing': (
+        r'marketing', r'promo', r'newsletter', r'campaign',
+        r'social', r'media', r'pr'
+    ),
+    'hr': (
+        r'hr', r'human', r'resources', r'recruitment',
+        r'careers', r'jobs', r'talent'
+    )
+}
+
+# One compiled word-bounded alternation per category
+_CATEGORY_RE = {
+    category: re.compile(r'\b(?:' + '|'.join(patterns) + r')\b', re.IGNORECASE)
+    for category, patterns in _CATEGORY_PATTERNS.items()
+}
+
+@dataclass(frozen=True, slots=True)
 class EmailPatterns:
     """Email extraction and validation patterns"""
-    
-    # Basic email regex
-    EMAIL_REGEX = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    
-    # Common fake email patterns to exclude
-    FAKE_PATTERNS = [
-        r'noreply', r'no-reply', r'donotreply', r'test@',
-        r'admin@example', r'user@example', r'contact@example',
-        r'webmaster@example', r'info@example', r'@example\.com',
-        r'sample@', r'demo@', r'placeholder@'
-    ]
-    
-    # Email categorization patterns
-    CATEGORY_PATTERNS = {
-        'sales': [
-            r'sales', r'business', r'commercial', r'revenue',
-            r'partnerships', r'enterprise', r'accounts'
-        ],
-        'support': [
-            r'support', r'help', r'service', r'assistance',
-            r'helpdesk', r'care', r'ticket'
-        ],
-        'info': [
-            r'info', r'contact', r'hello', r'general',
-            r'inquiry', r'questions'
-        ],
-        'admin': [
-            r'admin', r'webmaster', r'postmaster', r'system',
-            r'technical', r'it', r'tech'
-        ],
-        'marketing': [
-            r'marketing', r'promo', r'newsletter', r'campaign',
-            r'social', r'media', r'pr'
-        ],
-        'hr': [
-            r'hr', r'human', r'resources', r'recruitment',
-            r'careers', r'jobs', r'talent'
-        ]
-    }
 
+    # Basic email regex (compiled once at import)
+    EMAIL_REGEX: re.Pattern = re.compile(
+        r'\b[A-Za-z0-9._%+-]{1,64}@'
+        r'(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,24}\b'
+    )
+
+    FAKE_PATTERNS: tuple[str, ...] = _FAKE_PATTERNS
+
+    # All fake patterns merged into a single alternation
+    FAKE_RE: re.Pattern = re.compile('|'.join(f'(?:{p})' for p in _FAKE_PATTERNS), re.IGNORECASE)
+
+    CATEGORY_PATTERNS: Mapping[str, tuple[str, ...]] = field(
+        default_factory=lambda: MappingProxyType(_CATEGORY_PATTERNS)
+    )
+    CATEGORY_RE: Mapping[str, re.Pattern] = field(
+        default_factory=lambda: MappingProxyType(_CATEGORY_RE)
+    )
+
+# Shared read-only UI tables
+_COLORS = {
+    'primary': '#1f77b4',
+    'success': '#2ca02c',
+    'warning': '#ff7f0e',
+    'error': '#d62728',
+    'info': '#17becf'
+}
+
+_PROGRESS_MESSAGES = {
+    'loading_models': "🤖 Loading available AI models...",
+    'validating_input': "✅ Validating input data...",
+    'generating_prompt': "📝 Generating search strategy...",
+    'searching_web': "🌐 Searching the web for contacts...",
+    'processing_results': "📊 Processing and analyzing results...",
+    'extracting_requests': "🔍 Extracting with HTTP requests...",
+    'extracting_selenium': "🌐 Extracting with browser automation...",
+    'searching_sitemap': "🗺️ Searching sitemap...",
+    'categorizing': "📋 Categorizing email addresses...",
+    'finalizing': "✨ Finalizing results..."
+}
+
+_HELP_TEXTS = {
+    'api_key': "Get your API key from openrouter.ai - required for AI search",
+    'company_name': "Enter the exact company name as it appears officially",
+    'website_url': "Main company website (with or without https://)",
+    'country': "Primary company location or headquarters",
+    'search_depth': "Deep research takes longer but provides more comprehensive results",
+    'extraction_method': "Auto tries requests first, then Selenium if needed",
+    'sitemap_search': "Also search sitemap.xml for additional email addresses",
+    'categorization': "Group emails by type (sales, support, admin, etc.)"
+}
+
+@dataclass(frozen=True, slots=True)
 class UIConfig:
     """UI/UX configuration settings"""
-    
+
     # Streamlit page config
-    PAGE_TITLE = "Email Finder Pro"
-    PAGE_ICON = "📧"
-    LAYOUT = "wide"
-    INITIAL_SIDEBAR_STATE = "expanded"
-    
+    PAGE_TITLE: str = "Email Finder Pro"
+    PAGE_ICON: str = "📧"
+    LAYOUT: str = "wide"
+    INITIAL_SIDEBAR_STATE: str = "expanded"
+
     # Color scheme
-    COLORS = {
-        'primary': '#1f77b4',
-        'success': '#2ca02c',
-        'warning': '#ff7f0e',
-        'error': '#d62728',
-        'info': '#17becf'
-    }
-    
+    COLORS: Mapping[str, str] = field(default_factory=lambda: MappingProxyType(_COLORS))
+
     # Progress messages
-    PROGRESS_MESSAGES = {
-        'loading_models': "🤖 Loading available AI models...",
-        'validating_input': "✅ Validating input data...",
-        'generating_prompt': "📝 Generating search strategy...",
-        'searching_web': "🌐 Searching the web for contacts...",
-        'processing_results': "📊 Processing and analyzing results...",
-        'extracting_requests': "🔍 Extracting with HTTP requests...",
-        'extracting_selenium': "🌐 Extracting with browser automation...",
-        'searching_sitemap': "🗺️ Searching sitemap...",
-        'categorizing': "📋 Categorizing email addresses...",
-        'finalizing': "✨ Finalizing results..."
-    }
-    
+    PROGRESS_MESSAGES: Mapping[str, str] = field(
+        default_factory=lambda: MappingProxyType(_PROGRESS_MESSAGES)
+    )
+
     # Help texts
-    HELP_TEXTS = {
-        'api_key': "Get your API key from openrouter.ai - required for AI search",
-        'company_name': "Enter the exact company name as it appears officially",
-        'website_url': "Main company website (with or without https://)",
-        'country': "Primary company location or headquarters",
-        'search_depth': "Deep research takes longer but provides more comprehensive results",
-        'extraction_method': "Auto tries requests first, then Selenium if needed",
-        'sitemap_search': "Also search sitemap.xml for additional email addresses",
-        'categorization': "Group emails by type (sales, support, admin, etc.)"
-    }
-
-# Create global config instance
-config = AppConfig()
+    HELP_TEXTS: Mapping[str, str] = field(default_factory=lambda: MappingProxyType(_HELP_TEXTS))
+
+@functools.lru_cache(maxsize=None)
+def get_config() -> AppConfig:
+    """Return the process-wide configuration, loading it on first use"""
+    return AppConfig.from_env()
+
+def __getattr__(name: str) -> Any:
+    # `from config.settings import config` predates get_config(); resolve it lazily
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+@functools.lru_cache(maxsize=1)
+def validate_and_warn() -> bool:
+    """Validate the configuration once per process and log any problems"""
+    config = get_config()
+    is_valid, config_errors = config.validate_config()
+    if not is_valid and config.OPENROUTER_API_KEY:  # Only show errors if API key is set
+        for error in config_errors:
+            logger.warning(f"Configuration warning: {error}")
+    return is_valid
+
+# Pattern and UI tables have no environment dependency
 email_patterns = EmailPatterns()
 ui_config = UIConfig()
-
-# Validate configuration on import
-is_valid, config_errors = config.validate_config()
-if not is_valid and config.OPENROUTER_API_KEY:  # Only show errors if API key is set
-    print("Configuration warnings:")
-    for error in config_errors:
-        print(f"  - {error}")
@@ -1,22 +1,26 @@
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import asyncio
+import atexit
 import logging
-import time
 import re
 import csv
+import functools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Set, Dict, Optional, Tuple
-from urllib.parse import urljoin, urlparse
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+from html import unescape
+from io import StringIO
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, AsyncIterable, FrozenSet, Iterable, List, Set, Dict, Optional, Tuple
+from urllib.parse import unquote, urljoin, urlparse
+import httpx
 import validators
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
+from config.settings import get_config, validate_and_warn
+
+if TYPE_CHECKING:
+    from selenium import webdriver
 
 # Configure logging
 logging.basicConfig(
@@ -25,50 +29,425 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class EmailExtractor:
-    """Advanced email extraction with multiple methods"""
+# Compiled once at import; shared (thread-safe) across extractor instances.
+# The local part is capped at 64 chars (RFC 5321) and domain labels are bounded and
+# dot-free, so long runs of word characters or ".-.-." can't backtrack quadratically;
+# the character classes already cover both cases, so no IGNORECASE is needed.
+_EMAIL_RE = re.compile(
+    r'\b[A-Za-z0-9._%+-]{1,64}@'
+    r'(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,24}\b'
+)
+
+# True once the document and every subresource it requested have finished loading
+_PAGE_SETTLED_JS = (
+    'return document.readyState === "complete" && '
+    'window.performance.getEntriesByType("resource").every(r => r.responseEnd > 0)'
+)
+
+# Rendered text of every contact/email section, gathered in-page in one call
+_CONTACT_SECTIONS_JS = (
+    'return Array.from(document.querySelectorAll('
+    '"[class*=\'contact\'], [id*=\'contact\'], [class*=\'email\'], [id*=\'email\']"'
+    '), el => el.innerText).join("\\n");'
+)
+
+# Infinite-scroll handling: scroll at most this many times, waiting briefly for growth
+_MAX_SCROLLS = 3
+_SCROLL_GROWTH_TIMEOUT = 0.3
+_RENDER_SETTLE_CAP = 2.0
+
+# Selenium path in one async round-trip: poll until the page settles (giving up
+# after arguments[0] ms and using whatever DOM has loaded, since a slow third-party
+# frame can hold off "complete" indefinitely), scroll while a MutationObserver
+# shows it still growing, then hand back the rendered HTML, the contact-section
+# text and whether the page settled
+_RENDER_PAGE_JS = '''
+const done = arguments[arguments.length - 1];
+const deadline = Date.now() + arguments[0];
+const settled = () => { %(settled)s };
+const sections = () => { try { %(sections)s } catch (e) { return ""; } };
+let scrolls = 0, height = -1, quiet, cap, loaded = true;
+const finish = () => {
+  observer.disconnect();
+  clearTimeout(quiet);
+  clearTimeout(cap);
+  done([document.documentElement.outerHTML, sections(), loaded]);
+};
+const scroll = () => {
+  if (scrolls >= %(max_scrolls)d || document.body.scrollHeight === height) return finish();
+  scrolls++;
+  height = document.body.scrollHeight;
+  window.scrollTo(0, height);
+  quiet = setTimeout(scroll, %(quiet_ms)d);
+};
+const observer = new MutationObserver(() => {
+  clearTimeout(quiet);
+  quiet = setTimeout(scroll, %(quiet_ms)d);
+});
+const start = () => {
+  observer.observe(document, {subtree: true, childList: true});
+  cap = setTimeout(finish, %(cap_ms)d);
+  scroll();
+};
+const poll = () => {
+  if (settled()) {
+    start();
+  } else if (Date.now() > deadline) {
+    loaded = false;
+    start();
+  } else {
+    setTimeout(poll, 50);
+  }
+};
+poll();
+''' % {
+    'settled': _PAGE_SETTLED_JS,
+    'sections': _CONTACT_SECTIONS_JS,
+    'max_scrolls': _MAX_SCROLLS,
+    'quiet_ms': _SCROLL_GROWTH_TIMEOUT * 1000,
+    'cap_ms': _RENDER_SETTLE_CAP * 1000
+}
+
+# Placeholder and third-party domains whose addresses are never the site's own
+_EXCLUDED_DOMAINS = frozenset({
+    'example.com', 'test.com', 'domain.com', 'yoursite.com',
+    'sentry.io', 'google.com', 'facebook.com', 'twitter.com',
+    'linkedin.com', 'instagram.com', 'youtube.com', 'wordpress.com'
+})
+
+# mailto: targets in raw markup, stopping before any ?subject=/&body= query
+_MAILTO_RE = re.compile(r'mailto:([^"\'?\s>]+)', re.IGNORECASE)
+
+# Byte-level variants for scanning raw static HTML without building a parse tree
+_EMAIL_BYTES_RE = re.compile(_EMAIL_RE.pattern.encode())
+_MAILTO_BYTES_RE = re.compile(_MAILTO_RE.pattern.encode(), re.IGNORECASE)
+# An unclosed script/style (e.g. cut off by the page-size cap) runs to the end
+_SCRIPT_STYLE_RE = re.compile(rb'<(script|style)\b.*?(?:</\1\s*>|\Z)', re.IGNORECASE | re.DOTALL)
+# As in the HTML tokenizer, '<' only opens a tag before a letter, '/', '!' or '?';
+# otherwise ("a < b") it is text
+_TAG_OPEN_RE = re.compile(rb'<[A-Za-z/!?]')
+
+# An entity-encoded '@' (&#64; / &#x40; / &commat;), as written by email-obfuscation
+# plugins; such pages are entity-decoded before scanning
+_ENCODED_AT_RE = re.compile(rb'&#0*64(?![0-9])|&#x0*40(?![0-9a-f])|&commat;', re.IGNORECASE)
+
+# Token delimiters for the '@'-anchored scan (the bytes that rb'\s' matches)
+_WHITESPACE = (b' ', b'\n', b'\t', b'\r', b'\f', b'\v')
+_WHITESPACE_RE = re.compile(rb'\s')
+
+# Auto mode only launches a browser when the static pass finds fewer emails than
+# this and the page looks client-rendered (framework markers or almost no text)
+_AUTO_FALLBACK_THRESHOLD = 3
+_SPA_MARKERS_RE = re.compile(
+    rb'__NEXT_DATA__|__NUXT__|/_next/|/_nuxt/|data-reactroot|ng-version|ng-app|data-v-app'
+    rb'|\b(?:react|vue|angular)(?:[.-][\w.-]*)?\.js\b',
+    re.IGNORECASE
+)
+_TAG_RE = re.compile(rb'<[^>]*>')
+_MIN_STATIC_TEXT = 500
+
+# Obvious fake/automated addresses, merged into one alternation
+_FAKE_PATTERNS = (
+    r'noreply', r'no-reply', r'donotreply', r'test@',
+    r'admin@example', r'user@example', r'contact@example'
+)
+_FAKE_RE = re.compile('|'.join(f'(?:{p})' for p in _FAKE_PATTERNS), re.IGNORECASE)
+
+# Category keywords in priority order (an address matching several goes to the first)
+_CATEGORY_PATTERNS = {
+    'sales': (r'sales', r'business', r'commercial'),
+    'support': (r'support', r'help', r'service'),
+    'info': (r'info', r'contact', r'hello'),
+    'admin': (r'admin', r'webmaster', r'postmaster')
+}
+
+# One anchored scan per local part: each branch is a lookahead tried in priority
+# order, and the empty named group it sets reports the category via m.lastgroup
+_CATEGORY_RE = re.compile(
+    '^(?:' + '|'.join(
+        f'(?=.*?(?:{"|".join(patterns)}))(?P<{category}>)'
+        for category, patterns in _CATEGORY_PATTERNS.items()
+    ) + ')'
+)
+
+@functools.cache
+def _re2_sets() -> Optional[Tuple[object, object]]:
+    """Compile the fake and category patterns into RE2 sets, or None without RE2"""
+    try:
+        import re2
+    except ImportError:
+        return None
     
-    def __init__(self):
-        self.email_pattern = re.compile(
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            re.IGNORECASE
+    options = re2.Options()
+    options.case_sensitive = False
+    
+    fake_set = re2.Set.SearchSet(options)
+    for pattern in _FAKE_PATTERNS:
+        fake_set.Add(pattern)
+    fake_set.Compile()
+    
+    # Set indices follow _CATEGORY_PATTERNS order, so the lowest match wins
+    category_set = re2.Set.SearchSet(options)
+    for patterns in _CATEGORY_PATTERNS.values():
+        category_set.Add('|'.join(patterns))
+    category_set.Compile()
+    
+    return fake_set, category_set
+
+_CATEGORY_NAMES = tuple(_CATEGORY_PATTERNS)
+
+def _is_fake(email: str) -> bool:
+    """True if the address matches any fake/automated pattern"""
+    sets = _re2_sets()
+    if sets is not None:
+        return bool(sets[0].Match(email))
+    return _FAKE_RE.search(email) is not None
+
+def _match_category(local_part: str) -> Optional[str]:
+    """Highest-priority category whose keywords appear in the local part, if any"""
+    sets = _re2_sets()
+    if sets is not None:
+        matches = sets[1].Match(local_part)
+        return _CATEGORY_NAMES[min(matches)] if matches else None
+    match = _CATEGORY_RE.match(local_part)
+    return match.lastgroup if match else None
+
+@functools.cache
+def _lazy_imports() -> SimpleNamespace:
+    """Import the browser/parse stack on first Selenium use, not at app start"""
+    from bs4 import BeautifulSoup
+    from bs4.element import CData, NavigableString
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+    
+    # Prefer the C-based lxml parser, but keep working without it
+    try:
+        import lxml  # noqa: F401
+        html_parser = 'lxml'
+    except ImportError:
+        html_parser = 'html.parser'
+    
+    return SimpleNamespace(
+        BeautifulSoup=BeautifulSoup,
+        html_parser=html_parser,
+        # String node types that soup.get_text() includes (skips comments, scripts, styles)
+        text_node_types=(NavigableString, CData),
+        webdriver=webdriver,
+        Options=Options,
+        TimeoutException=TimeoutException,
+        WebDriverException=WebDriverException
+    )
+
+# Rolling buffer for streamed text scans; the overlap is longer than any valid
+# address (RFC 5321 caps them at 254 chars) so boundary-straddling emails survive
+_SCAN_CHUNK_SIZE = 64 * 1024
+_SCAN_OVERLAP = 320
+
+def _scan_emails(chunks: Iterable[str]) -> List[str]:
+    """Regex-scan a stream of text chunks without joining them into one string"""
+    found = []
+    parts = []
+    size = 0
+    
+    for chunk in chunks:
+        parts.append(chunk)
+        size += len(chunk)
+        if size < _SCAN_CHUNK_SIZE:
+            continue
+        
+        buffer = ''.join(parts)
+        keep_from = len(buffer) - _SCAN_OVERLAP
+        # A C-level '@' test skips the regex engine for the (usual) address-free chunk
+        if '@' in buffer:
+            for match in _EMAIL_RE.finditer(buffer):
+                if match.end() >= keep_from:
+                    # May continue in the next chunk; rescan it with the tail
+                    keep_from = min(keep_from, match.start())
+                    break
+                found.append(match.group())
+        
+        tail = buffer[keep_from:]
+        parts = [tail]
+        size = len(tail)
+    
+    rest = ''.join(parts)
+    if '@' in rest:
+        found.extend(_EMAIL_RE.findall(rest))
+    return found
+
+def _looks_js_rendered(html: bytes) -> bool:
+    """Guess whether static HTML is a client-rendered shell a browser could fill in"""
+    if _SPA_MARKERS_RE.search(html):
+        return True
+    text = _TAG_RE.sub(b'', _SCRIPT_STYLE_RE.sub(b'', html))
+    return len(b''.join(text.split())) < _MIN_STATIC_TEXT
+
+# Static pages are read up to this size; contact details live in the header/footer
+# of real pages, and the cap bounds memory and scan time on huge documents
+_MAX_PAGE_BYTES = 2 * 1024 * 1024
+_PAGE_READ_CHUNK = 64 * 1024
+
+def _read_capped(chunks: Iterable[bytes]) -> bytes:
+    """Join streamed body chunks, stopping once _MAX_PAGE_BYTES have arrived"""
+    parts = []
+    total = 0
+    for chunk in chunks:
+        parts.append(chunk)
+        total += len(chunk)
+        if total >= _MAX_PAGE_BYTES:
+            break
+    return b''.join(parts)
+
+async def _aread_capped(chunks: AsyncIterable[bytes]) -> bytes:
+    """Async counterpart of _read_capped for the bulk extractor's streamed bodies"""
+    parts = []
+    total = 0
+    async for chunk in chunks:
+        parts.append(chunk)
+        total += len(chunk)
+        if total >= _MAX_PAGE_BYTES:
+            break
+    return b''.join(parts)
+
+def _tag_state(data: bytes, start: int, end: int, in_tag: bool) -> bool:
+    """Whether ``end`` follows an unclosed tag '<', given the same for ``start``"""
+    lt = _rfind_tag_open(data, start, end)
+    gt = data.rfind(b'>', start, end)
+    return in_tag if lt == gt else lt > gt  # Equal only when neither occurs
+
+def _rfind_tag_open(data: bytes, start: int, end: int) -> int:
+    """Last '<' in ``data[start:end]`` that opens a tag, or -1"""
+    lt = data.rfind(b'<', start, end)
+    while lt != -1 and not _TAG_OPEN_RE.match(data, lt):
+        lt = data.rfind(b'<', start, lt)
+    return lt
+
+def _rfind_outside(data: bytes, needle: bytes, spans: List[Tuple[int, int]]) -> int:
+    """Last index of ``needle`` outside the sorted (start, end) ``spans``, or -1"""
+    end = len(data)
+    for span_start, span_end in reversed(spans):
+        pos = data.rfind(needle, span_end, end)
+        if pos != -1:
+            return pos
+        end = span_start
+    return data.rfind(needle, 0, end)
+
+def _scan_at_tokens(data: bytes, skip_spans: List[Tuple[int, int]] = ()) -> List[str]:
+    """Run the email regex only on the whitespace-delimited tokens around each '@'
+    in the text of raw markup
+    
+    '@'s inside tags (src="logo@2x.png", srcset, hrefs) or ``skip_spans`` (sorted,
+    non-overlapping (start, end) pairs) are ignored, and tokens stop at tag edges.
+    """
+    # Addresses never contain whitespace, and '@' is found with a C-level
+    # memchr, so the regex engine never sees the (usual) address-free text
+    # Each byte is looked at a bounded number of times: token edges are only
+    # searched between the previous token's end and the next '@'
+    found = []
+    prev_stop = 0
+    # Tag state is carried forward from '@' to '@' (skipped spans don't count,
+    # as if they had been cut out), so the '<'/'>' lookback never revisits bytes.
+    # A '<' with no '>' anywhere after it (e.g. a page cut off by the size cap)
+    # doesn't open a tag.
+    in_tag = False
+    tag_checked = 0
+    last_gt = _rfind_outside(data, b'>', skip_spans)
+    spans = iter(skip_spans)
+    span = next(spans, None)
+    at = data.find(b'@')
+    while at != -1:
+        while span and span[1] <= at:
+            # Tokens never reach back into a skipped span
+            prev_stop = max(prev_stop, span[1])
+            in_tag = _tag_state(data, tag_checked, span[0], in_tag)
+            tag_checked = span[1]
+            span = next(spans, None)
+        if span and span[0] <= at:
+            at = data.find(b'@', span[1])
+            continue
+        
+        in_tag = _tag_state(data, tag_checked, at, in_tag)
+        tag_checked = at
+        if in_tag and at < last_gt:
+            at = data.find(b'@', at + 1)
+            continue
+        
+        start = max(
+            prev_stop,
+            data.rfind(b'>', prev_stop, at) + 1,
+            max(data.rfind(ws, prev_stop, at) for ws in _WHITESPACE) + 1
         )
-        self.excluded_domains = {
-            'example.com', 'test.com', 'domain.com', 'yoursite.com',
-            'sentry.io', 'google.com', 'facebook.com', 'twitter.com',
-            'linkedin.com', 'instagram.com', 'youtube.com', 'wordpress.com'
-        }
+        limit = span[0] if span else len(data)
+        next_tag = data.find(b'<', at, limit)
+        if next_tag != -1 and next_tag < last_gt:
+            limit = next_tag
+        space = _WHITESPACE_RE.search(data, at, limit)
+        stop = space.start() if space else limit
         
+        token = data[start:stop]
+        if b'&' in token or not token.isascii():
+            # Partly entity-encoded address such as &#115;ales@acme.com, or non-ASCII
+            # text, where bytes-mode \b would split "müller@acme.de" after the "ü"
+            found.extend(_EMAIL_RE.findall(unescape(token.decode('utf-8', 'replace'))))
+        else:
+            found.extend(m.decode('ascii') for m in _EMAIL_BYTES_RE.findall(token))
+        prev_stop = stop
+        at = data.find(b'@', stop)
+    return found
+
+@st.cache_resource
+def _get_http_client() -> httpx.Client:
+    """Process-wide pooled HTTP/2 client for static page fetches"""
+    return httpx.Client(
+        http2=True,
+        headers=dict(get_config().get_request_headers()),
+        timeout=get_config().REQUEST_TIMEOUT,
+        follow_redirects=True
+    )
+
+@functools.lru_cache(maxsize=4096)
+def _passes_email_filters(email: str) -> bool:
+    """Cheapest checks first: length, excluded domain, fake patterns, then the full regex"""
+    # Shortest plausible address is a@b.cc; RFC 5321 caps paths at 254
+    if not 6 <= len(email) <= 254:
+        return False
+    
+    local, _, domain = email.rpartition('@')
+    
+    # Filter out common excluded domains
+    if domain.lower() in _EXCLUDED_DOMAINS:
+        return False
+    
+    # Filter out obvious fake emails
+    if _is_fake(email):
+        return False
+    
+    # Dot placement the regex allows but RFC 5322 dot-atoms don't
+    if '..' in email or local.startswith('.') or local.endswith('.'):
+        return False
+    
+    if _EMAIL_RE.fullmatch(email) is None:
+        return False
+    
+    # Optional full RFC parse; the checks above already cover scraped addresses
+    return not get_config().STRICT_EMAIL_VALIDATION or bool(validators.email(email))
+
+class EmailExtractor:
+    """Advanced email extraction with multiple methods"""
+    
     def _is_valid_email(self, email: str) -> bool:
         """Validate email with additional filters"""
-        try:
-            if not validators.email(email):
-                return False
-            
-            domain = email.split('@')[1].lower()
-            
-            # Filter out common excluded domains
-            if domain in self.excluded_domains:
-                return False
-            
-            # Filter out obvious fake emails
-            fake_patterns = [
-                r'noreply', r'no-reply', r'donotreply', r'test@',
-                r'admin@example', r'user@example', r'contact@example'
-            ]
-            
-            for pattern in fake_patterns:
-                if re.search(pattern, email.lower()):
-                    return False
-            
-            return True
-            
-        except Exception:
-            return False
+        return _passes_email_filters(email)
+    
+    def _validate_candidates(self, candidates) -> Set[str]:
+        """Lowercase and deduplicate candidates, then validate each unique one once"""
+        return {email for email in {c.lower() for c in candidates} if self._is_valid_email(email)}
     
-    def _configure_selenium(self) -> webdriver.Chrome:
+    def _configure_selenium(self) -> "webdriver.Chrome":
         """Configure Selenium WebDriver with optimized options"""
-        chrome_options = Options()
+        lazy = _lazy_imports()
+        chrome_options = lazy.Options()
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--no-sandbox")
@@ -78,160 +457,477 @@ class EmailExtractor:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
+        # Only the DOM and its text matter; skip rendering work and heavy assets
+        chrome_options.add_argument("--window-size=800,600")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+        # Return from get() at DOMContentLoaded; extract_with_selenium waits for the rest
+        chrome_options.page_load_strategy = 'eager'
+        
         try:
-            driver = webdriver.Chrome(
-                ChromeDriverManager().install(),
-                options=chrome_options
-            )
+            # Selenium Manager resolves (and caches) a matching chromedriver natively
+            driver = lazy.webdriver.Chrome(options=chrome_options)
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            # The render script bounds itself; leave room for its load wait and settle cap
+            driver.set_script_timeout(get_config().SELENIUM_TIMEOUT + _RENDER_SETTLE_CAP + 5)
             return driver
         except Exception as e:
             logger.error(f"Failed to initialize Chrome driver: {e}")
             raise
     
-    def extract_with_requests(self, url: str) -> Set[str]:
-        """Extract emails using requests (faster, but limited)"""
-        emails = set()
-        
+    def _get_driver(self) -> "webdriver.Chrome":
+        """Return the session's shared Chrome driver, starting it on first use"""
+        # Module globals are reset on every Streamlit rerun, so keep the
+        # driver in session state to amortize Chrome startup across URLs
+        driver = st.session_state.get('driver')
+        if driver is None:
+            driver = self._configure_selenium()
+            st.session_state['driver'] = driver
+            # Weak references only, so a finished session's driver can be collected;
+            # stopping its chromedriver service then closes that browser too
+            _open_drivers().add(driver)
+            weakref.finalize(driver, _stop_service, driver.service)
+        return driver
+    
+    def _release_driver(self, driver: "webdriver.Chrome"):
+        """Reset the shared driver between URLs instead of quitting it"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
+            driver.delete_all_cookies()
+            driver.get('about:blank')
+        except Exception:
+            self._discard_driver()
+    
+    def _discard_driver(self):
+        """Quit a broken shared driver so the next call starts a fresh one"""
+        driver = st.session_state.pop('driver', None)
+        if driver:
+            _quit_driver(driver)
+    
+    def _extract_from_page_source(self, html: str) -> Set[str]:
+        """Collect mailto targets from the raw markup and text emails from the parse tree"""
+        lazy = _lazy_imports()
+        
+        # Mailto links: one regex pass over the markup, no per-anchor Tag lookups
+        candidates = [unquote(m).strip() for m in _MAILTO_RE.findall(html)]
+        
+        # Extract from text content as it streams past
+        soup = lazy.BeautifulSoup(html, lazy.html_parser)
+        text_node_types = lazy.text_node_types
+        candidates.extend(_scan_emails(
+            element for element in (soup.body or soup).descendants
+            if element.__class__ in text_node_types
+        ))
+        
+        return self._validate_candidates(candidates)
+    
+    def _fast_extract(self, url: str) -> Tuple[Set[str], bool]:
+        """Fetch static HTML over pooled HTTP/2, scan it for emails and flag JS-rendered pages"""
+        with _get_http_client().stream('GET', url) as response:
             response.raise_for_status()
+            html = _read_capped(response.iter_bytes(_PAGE_READ_CHUNK))
+        
+        emails = self._parse_html(html)
+        # The hint only matters when the static pass came up short
+        needs_js = len(emails) < _AUTO_FALLBACK_THRESHOLD and _looks_js_rendered(html)
+        return emails, needs_js
+    
+    def _parse_html(self, html: bytes) -> Set[str]:
+        """Extract emails from raw static HTML with byte regexes (CPU-bound)"""
+        # Encoded '@'s hide both text and mailto addresses from the byte regexes
+        # (a browser or parser would have decoded them), so decode those pages first
+        if _ENCODED_AT_RE.search(html):
+            html = unescape(html.decode('utf-8', 'replace')).encode('utf-8')
+        
+        # Extract from mailto links
+        candidates = [unquote(m.decode('ascii', 'ignore')).strip()
+                      for m in _MAILTO_BYTES_RE.findall(html)]
+        
+        # Extract from the text between tags in place, skipping script/style bodies
+        # and attribute values, without making a tag-stripped copy of the page
+        script_spans = [m.span() for m in _SCRIPT_STYLE_RE.finditer(html)]
+        candidates.extend(_scan_at_tokens(html, script_spans))
+        
+        return self._validate_candidates(candidates)
+    
+    def extract_with_requests(self, url: str) -> Tuple[Set[str], bool]:
+        """Extract emails from static HTML (faster, but limited), plus whether the
+        page likely needs a browser to render its content"""
+        try:
+            emails, needs_js = _cached_static_emails(url)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract from mailto links
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if href.startswith('mailto:'):
-                    email = href[7:].split('?')[0]  # Remove query parameters
-                    if self._is_valid_email(email):
-                        emails.add(email.lower())
-            
-            # Extract from text content
-            text_content = soup.get_text()
-            found_emails = self.email_pattern.findall(text_content)
-            
-            for email in found_emails:
-                if self._is_valid_email(email):
-                    emails.add(email.lower())
-            
-            logger.info(f"Requests method found {len(emails)} emails")
-            return emails
+            logger.info(f"Requests method found {len(emails)} emails (needs_js={needs_js})")
+            return set(emails), needs_js
             
         except Exception as e:
             logger.warning(f"Requests extraction failed: {e}")
-            return set()
+            # Nothing was fetched, so only a browser can tell
+            return set(), True
+    
+    async def extract_many(self, urls: List[str], concurrency: int = 16) -> Dict[str, Set[str]]:
+        """Fetch and parse many static pages concurrently, rate limited per host"""
+        config = get_config()
+        semaphore = asyncio.Semaphore(concurrency)
+        host_locks: Dict[str, asyncio.Lock] = {}
+        
+        async def extract_one(client: httpx.AsyncClient, url: str) -> Set[str]:
+            lock = host_locks.setdefault(urlparse(url).netloc, asyncio.Lock())
+            async with lock:
+                try:
+                    async with semaphore:
+                        async with client.stream('GET', url) as response:
+                            response.raise_for_status()
+                            html = await _aread_capped(response.aiter_bytes(_PAGE_READ_CHUNK))
+                    # Parse off the event loop so other fetches keep flowing
+                    return await asyncio.to_thread(self._parse_html, html)
+                except Exception as e:
+                    logger.warning(f"Bulk extraction failed for {url}: {e}")
+                    return set()
+                finally:
+                    await asyncio.sleep(config.RATE_LIMIT_DELAY)
+        
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(
+            http2=True,
+            headers=dict(config.get_request_headers()),
+            timeout=config.REQUEST_TIMEOUT,
+            follow_redirects=True,
+            limits=limits
+        ) as client:
+            results = await asyncio.gather(*(extract_one(client, url) for url in urls))
+        
+        logger.info(f"Bulk extraction processed {len(urls)} URLs")
+        return dict(zip(urls, results))
     
-    def extract_with_selenium(self, url: str) -> Set[str]:
-        """Extract emails using Selenium (more thorough)"""
-        emails = set()
-        driver = None
+    def extract_with_selenium(self, url: str, driver: Optional["webdriver.Chrome"] = None) -> Set[str]:
+        """Extract emails using Selenium (more thorough)
+        
+        Pass ``driver`` to use a caller-owned browser; it is left as-is afterwards.
+        Otherwise the per-URL cache is consulted, and on a miss the page is
+        rendered on the session's shared driver, which is reset for the next URL.
+        """
+        lazy = _lazy_imports()
         
         try:
-            driver = self._configure_selenium()
-            driver.get(url)
-            
-            # Wait for page to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, 'body'))
-            )
-            
-            # Scroll to load dynamic content
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-            
-            # Get page source and parse
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            # Extract from mailto links
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if href.startswith('mailto:'):
-                    email = href[7:].split('?')[0]
-                    if self._is_valid_email(email):
-                        emails.add(email.lower())
-            
-            # Extract from text content
-            text_content = soup.get_text()
-            found_emails = self.email_pattern.findall(text_content)
-            
-            for email in found_emails:
-                if self._is_valid_email(email):
-                    emails.add(email.lower())
-            
-            # Look for hidden or dynamically loaded content
-            try:
-                # Check for contact forms or hidden sections
-                contact_sections = driver.find_elements(By.CSS_SELECTOR, 
-                    "[class*='contact'], [id*='contact'], [class*='email'], [id*='email']")
-                
-                for section in contact_sections:
-                    section_text = section.text
-                    section_emails = self.email_pattern.findall(section_text)
-                    for email in section_emails:
-                        if self._is_valid_email(email):
-                            emails.add(email.lower())
-            except Exception:
-                pass
+            if driver is None:
+                emails = set(_cached_rendered_emails(url))
+            else:
+                emails = self._render_and_extract(url, driver)
             
             logger.info(f"Selenium method found {len(emails)} emails")
             return emails
             
-        except TimeoutException:
+        except lazy.TimeoutException:
             logger.warning("Page load timeout")
             return set()
-        except WebDriverException as e:
+        except lazy.WebDriverException as e:
             logger.error(f"WebDriver error: {e}")
             return set()
         except Exception as e:
             logger.error(f"Selenium extraction failed: {e}")
             return set()
+    
+    def _extract_with_shared_driver(self, url: str) -> Set[str]:
+        """Render a page on the session's shared driver, then reset it (raises on failure)"""
+        lazy = _lazy_imports()
+        driver = self._get_driver()
+        
+        try:
+            return self._render_and_extract(url, driver)
+        except lazy.TimeoutException:
+            raise
+        except lazy.WebDriverException:
+            # Anything but a timeout may have left the browser unusable
+            self._discard_driver()
+            driver = None
+            raise
         finally:
             if driver:
-                try:
-                    driver.quit()
-                except Exception:
-                    pass
+                self._release_driver(driver)
+    
+    def _get_playwright(self) -> "_PlaywrightBrowser":
+        """Return the session's shared Playwright browser, starting it on first use"""
+        # Kept in session state for the same reason as the Selenium driver
+        browser = st.session_state.get('playwright_browser')
+        if browser is None:
+            browser = _PlaywrightBrowser()
+            st.session_state['playwright_browser'] = browser
+        return browser
+    
+    def _extract_with_playwright(self, url: str) -> Set[str]:
+        """Render a page on the session's Playwright browser and collect its emails (raises on failure)"""
+        browser = self._get_playwright()
+        try:
+            html, section_text = browser.render([url])[url]
+        except Exception:
+            # A page error leaves the browser usable; a crashed one is replaced next call
+            if not browser.is_connected():
+                st.session_state.pop('playwright_browser', None)
+                browser.close()
+            raise
+        
+        emails = self._extract_from_page_source(html)
+        emails |= self._validate_candidates(_EMAIL_RE.findall(section_text))
+        return emails
+    
+    def _render_and_extract(self, url: str, driver: "webdriver.Chrome") -> Set[str]:
+        """Load a page in the browser and collect its emails (raises on failure)"""
+        driver.get(url)
+        
+        # Wait for loading, scroll dynamic content in and read the page back in
+        # a single call instead of separate readiness/scroll/page_source RPCs
+        rendered = driver.execute_async_script(
+            _RENDER_PAGE_JS, get_config().SELENIUM_TIMEOUT * 1000
+        )
+        html, section_text, loaded = rendered
+        if not loaded:
+            logger.warning(f"{url} did not finish loading; extracting from the DOM so far")
+        
+        emails = self._extract_from_page_source(html)
+        
+        # Contact forms or hidden sections, gathered in the same call
+        emails |= self._validate_candidates(_EMAIL_RE.findall(section_text or ''))
+        
+        return emails
     
     def extract_from_sitemap(self, base_url: str) -> Set[str]:
         """Extract emails from sitemap URLs"""
-        emails = set()
-        
         try:
-            # Try common sitemap locations
-            sitemap_urls = [
-                urljoin(base_url, 'sitemap.xml'),
-                urljoin(base_url, 'sitemap_index.xml'),
-                urljoin(base_url, 'sitemap.txt')
-            ]
+            fetch = _cached_sitemap if get_config().ENABLE_SITEMAP_CACHE else _download_sitemap
             
-            for sitemap_url in sitemap_urls:
-                try:
-                    response = requests.get(sitemap_url, timeout=5)
-                    if response.status_code == 200:
-                        # Simple extraction from sitemap content
-                        found_emails = self.email_pattern.findall(response.text)
-                        for email in found_emails:
-                            if self._is_valid_email(email):
-                                emails.add(email.lower())
-                        break
-                except Exception:
-                    continue
-            
-            return emails
+            # Simple extraction from sitemap content
+            sitemap_text = fetch(base_url)
+            if '@' not in sitemap_text:
+                return set()
+            return self._validate_candidates(_EMAIL_RE.findall(sitemap_text))
             
         except Exception as e:
             logger.warning(f"Sitemap extraction failed: {e}")
             return set()
 
+# Per-URL results are reused across reruns for an hour. Failures raise through
+# the cache (and so aren't stored), so a transient error doesn't stick.
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_static_emails(url: str) -> Tuple[FrozenSet[str], bool]:
+    """Emails found in a page's static HTML, and whether it looks JS-rendered"""
+    emails, needs_js = EmailExtractor()._fast_extract(url)
+    return frozenset(emails), needs_js
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_rendered_emails(url: str) -> FrozenSet[str]:
+    """Emails found in a page rendered on the session's shared browser"""
+    extractor = EmailExtractor()
+    if get_config().BROWSER_BACKEND == 'playwright':
+        return frozenset(extractor._extract_with_playwright(url))
+    return frozenset(extractor._extract_with_shared_driver(url))
+
+# Asset types the browser never needs for email extraction
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'stylesheet', 'font', 'media'})
+
+class _PlaywrightBrowser:
+    """A headless Chromium context kept open on a private event loop thread
+    
+    Starting Playwright and Chromium costs far more than rendering a page, so one
+    instance serves all of a session's pages instead of launching per URL. Playwright
+    drives the browser over a single persistent connection instead of one HTTP call
+    per command.
+    """
+    
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=_run_loop, args=(self._loop,), name='playwright', daemon=True).start()
+        try:
+            self._playwright, self._browser, self._context = self._call(_launch_playwright())
+        except Exception:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            raise
+        # Closed when the session's state is dropped, or at interpreter exit
+        self._finalizer = weakref.finalize(self, _close_playwright, self._loop, self._playwright)
+    
+    def _call(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+    
+    def render(self, urls: List[str]) -> Dict[str, Tuple[str, str]]:
+        """Render pages concurrently; returns each URL's (page HTML, contact-section text)"""
+        return self._call(_render_with_playwright(self._context, urls))
+    
+    def is_connected(self) -> bool:
+        return self._browser.is_connected()
+    
+    def close(self):
+        self._finalizer()
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+async def _launch_playwright():
+    """Start Playwright and a Chromium context that skips asset downloads"""
+    from playwright.async_api import async_playwright
+    
+    config = get_config()
+    
+    async def block_assets(route):
+        if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    playwright = await async_playwright().start()
+    try:
+        browser = await playwright.chromium.launch(headless=True, args=['--disable-gpu', '--no-sandbox'])
+        context = await browser.new_context(
+            user_agent=config.USER_AGENT,
+            viewport={'width': 800, 'height': 600}
+        )
+        await context.route('**/*', block_assets)
+    except Exception:
+        # Stopping Playwright also kills a browser that did launch
+        await playwright.stop()
+        raise
+    return playwright, browser, context
+
+def _close_playwright(loop: asyncio.AbstractEventLoop, playwright) -> None:
+    """Stop a Playwright instance (and its browser) and then its event loop"""
+    try:
+        asyncio.run_coroutine_threadsafe(playwright.stop(), loop).result(timeout=10)
+    except Exception:
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+
+async def _render_with_playwright(context, urls: List[str]) -> Dict[str, Tuple[str, str]]:
+    """Render pages concurrently in a Playwright browser context
+    
+    Returns each URL's (page HTML, contact-section text).
+    """
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    
+    config = get_config()
+    
+    async def render(url: str) -> Tuple[str, str]:
+        page = await context.new_page()
+        try:
+            timeout_ms = config.SELENIUM_TIMEOUT * 1000
+            await page.goto(url, wait_until='domcontentloaded', timeout=timeout_ms)
+            try:
+                await page.wait_for_function(f'() => {{ {_PAGE_SETTLED_JS} }}', timeout=timeout_ms)
+            except PlaywrightTimeoutError:
+                # Keep the DOM that has loaded rather than dropping the page
+                logger.warning(f"{url} did not finish loading; extracting from the DOM so far")
+            
+            # Same bounded infinite-scroll handling as the Selenium path
+            for _ in range(_MAX_SCROLLS):
+                height = await page.evaluate('document.body.scrollHeight')
+                await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+                try:
+                    await page.wait_for_function(
+                        f'document.body.scrollHeight !== {height}',
+                        timeout=_SCROLL_GROWTH_TIMEOUT * 1000
+                    )
+                except PlaywrightTimeoutError:
+                    break
+            
+            html = await page.content()
+            section_text = await page.evaluate(f'() => {{ {_CONTACT_SECTIONS_JS} }}')
+            return html, section_text or ''
+        finally:
+            await page.close()
+    
+    try:
+        results = await asyncio.gather(*(render(url) for url in urls))
+    finally:
+        # Leave no cookies behind for the next pages, as the Selenium path does
+        await context.clear_cookies()
+    
+    return dict(zip(urls, results))
+
+def _download_sitemap(base_url: str) -> str:
+    """Return the body of the first sitemap found at a common location, or ''
+    
+    '' means every location answered that it has no sitemap. If none was found and
+    any probe failed transiently (network error, 429 or 5xx), the error is raised
+    instead, so the day-long cache never stores a blip as "no sitemap".
+    """
+    # Try common sitemap locations
+    sitemap_urls = [
+        urljoin(base_url, 'sitemap.xml'),
+        urljoin(base_url, 'sitemap_index.xml'),
+        urljoin(base_url, 'sitemap.txt')
+    ]
+    
+    # Probe all locations at once over the pooled client (HTTP/2 multiplexes them
+    # onto one connection), but still prefer them in the order listed above
+    client = _get_http_client()
+    executor = ThreadPoolExecutor(max_workers=len(sitemap_urls))
+    try:
+        futures = [executor.submit(client.get, sitemap_url, timeout=5) for sitemap_url in sitemap_urls]
+        transient_error = None
+        for future in futures:
+            try:
+                response = future.result()
+            except httpx.HTTPError as e:
+                transient_error = transient_error or e
+                continue
+            if response.status_code == 200:
+                return response.text
+            if response.status_code == 429 or response.status_code >= 500:
+                transient_error = transient_error or httpx.HTTPStatusError(
+                    f"Sitemap probe got HTTP {response.status_code}",
+                    request=response.request, response=response
+                )
+    finally:
+        # Don't wait on slower probes once we have an answer
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    if transient_error:
+        raise transient_error
+    return ''
+
+# Sitemaps rarely change; reuse them across reruns and sessions for a day.
+# Definite misses are cached too so sites without one don't cost three round-trips
+# each time; transient failures raise through the cache and are retried next run.
+_cached_sitemap = st.cache_data(ttl=86400, max_entries=256, show_spinner=False)(_download_sitemap)
+
+def _quit_driver(driver: "webdriver.Chrome"):
+    """Quit a Chrome driver, ignoring errors from already-closed sessions"""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+def _stop_service(service) -> None:
+    """Stop a garbage-collected driver's chromedriver, ignoring already-stopped ones"""
+    try:
+        service.stop()
+    except Exception:
+        pass
+
+@st.cache_resource(show_spinner=False)
+def _open_drivers() -> "weakref.WeakSet[webdriver.Chrome]":
+    """Drivers still alive in any session, quit together when the server exits"""
+    drivers = weakref.WeakSet()
+    
+    def quit_all():
+        for driver in list(drivers):
+            _quit_driver(driver)
+    
+    atexit.register(quit_all)
+    return drivers
+
+def _rows_to_csv(rows: List[Dict[str, object]]) -> bytes:
+    """Serialize a list of same-keyed dicts to UTF-8 CSV (header from the first row)"""
+    buffer = StringIO()
+    if rows:
+        writer = csv.DictWriter(buffer, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    return buffer.getvalue().encode('utf-8')
+
 class EmailAnalyzer:
     """Analyze and categorize extracted emails"""
     
@@ -247,27 +943,13 @@ class EmailAnalyzer:
             'personal': []
         }
         
-        patterns = {
-            'sales': [r'sales', r'business', r'commercial'],
-            'support': [r'support', r'help', r'service'],
-            'info': [r'info', r'contact', r'hello'],
-            'admin': [r'admin', r'webmaster', r'postmaster']
-        }
-        
         for email in emails:
             local_part = email.split('@')[0].lower()
-            categorized = False
-            
-            for category, pattern_list in patterns.items():
-                for pattern in pattern_list:
-                    if re.search(pattern, local_part):
-                        categories[category].append(email)
-                        categorized = True
-                        break
-                if categorized:
-                    break
+            category = _match_category(local_part)
             
-            if not categorized:
+            if category:
+                categories[category].append(email)
+            else:
                 # Check if it looks like a personal email
                 if '.' in local_part or len(local_part.split('.')) > 1:
                     categories['personal'].append(email)
@@ -283,6 +965,7 @@ def main():
         layout="wide",
         initial_sidebar_state="expanded"
     )
+    validate_and_warn()
     
     st.title("📧 Email Extractor Pro")
     st.markdown("*Advanced email extraction with multiple methods and analysis*")
@@ -347,43 +1030,65 @@ def main():
         status_text = st.empty()
         
         try:
-            # Method 1: Requests
-            if extraction_method in ["Auto (Requests + Selenium)", "Requests Only (Fast)"]:
-                status_text.text("🔍 Extracting with HTTP requests...")
-                progress_bar.progress(25)
+            # The methods are network-bound, so run them side by side. Workers get
+            # this script's run context so st.cache_*/session_state work in them.
+            ctx = get_script_run_ctx()
+            with ThreadPoolExecutor(
+                max_workers=3,
+                initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)
+            ) as executor:
+                requests_future = selenium_future = sitemap_future = None
+                needs_js = True
                 
-                requests_emails = extractor.extract_with_requests(url)
-                all_emails.update(requests_emails)
+                # Method 1: Requests
+                if extraction_method in ["Auto (Requests + Selenium)", "Requests Only (Fast)"]:
+                    requests_future = executor.submit(extractor.extract_with_requests, url)
                 
-                st.info(f"✅ Found {len(requests_emails)} emails with requests method")
-            
-            # Method 2: Selenium (if needed or requested)
-            if extraction_method in ["Auto (Requests + Selenium)", "Selenium Only (Thorough)"]:
-                # For auto mode, only use Selenium if requests found few emails
-                should_use_selenium = (
-                    extraction_method == "Selenium Only (Thorough)" or
-                    (extraction_method == "Auto (Requests + Selenium)" and len(all_emails) < 3)
-                )
+                # Method 2: Selenium (auto mode decides once the requests result is in,
+                # so static pages never start a browser)
+                if extraction_method == "Selenium Only (Thorough)":
+                    selenium_future = executor.submit(extractor.extract_with_selenium, url)
+                
+                # Method 3: Sitemap
+                if include_sitemap:
+                    sitemap_future = executor.submit(extractor.extract_from_sitemap, url)
+                
+                if requests_future:
+                    status_text.text("🔍 Extracting with HTTP requests...")
+                    progress_bar.progress(25)
+                    
+                    requests_emails, needs_js = requests_future.result()
+                    all_emails.update(requests_emails)
+                    
+                    st.info(f"✅ Found {len(requests_emails)} emails with requests method")
+                
+                # For auto mode, only use Selenium if requests found few emails on a
+                # page that looks client-rendered; plain HTML won't yield more
+                if (extraction_method == "Auto (Requests + Selenium)" and
+                        len(all_emails) < _AUTO_FALLBACK_THRESHOLD):
+                    if needs_js:
+                        selenium_future = executor.submit(extractor.extract_with_selenium, url)
+                    else:
+                        st.info("ℹ️ Page is static HTML, skipping browser automation")
                 
-                if should_use_selenium:
+                if selenium_future:
                     status_text.text("🌐 Extracting with browser automation...")
                     progress_bar.progress(50)
                     
-                    selenium_emails = extractor.extract_with_selenium(url)
+                    selenium_emails = selenium_future.result()
                     all_emails.update(selenium_emails)
                     
                     st.info(f"✅ Found {len(selenium_emails)} additional emails with Selenium")
-            
-            # Method 3: Sitemap
-            if include_sitemap:
-                status_text.text("🗺️ Searching sitemap...")
-                progress_bar.progress(75)
-                
-                sitemap_emails = extractor.extract_from_sitemap(url)
-                all_emails.update(sitemap_emails)
                 
-                if sitemap_emails:
-                    st.info(f"✅ Found {len(sitemap_emails)} emails in sitemap")
+                if sitemap_future:
+                    status_text.text("🗺️ Searching sitemap...")
+                    progress_bar.progress(75)
+                    
+                    sitemap_emails = sitemap_future.result()
+                    all_emails.update(sitemap_emails)
+                    
+                    if sitemap_emails:
+                        st.info(f"✅ Found {len(sitemap_emails)} emails in sitemap")
             
             # Finalize results
             progress_bar.progress(100)
@@ -393,8 +1098,8 @@ def main():
             if all_emails:
                 st.success(f"🎉 Found {len(all_emails)} unique email addresses")
                 
-                # Convert to sorted list
-                email_list = sorted(list(all_emails))
+                # Sort once, at display time (extraction methods return unordered sets)
+                email_list = sorted(all_emails)
                 
                 # Categorization
                 if categorize_results:
@@ -412,23 +1117,22 @@ def main():
                     for email in email_list:
                         st.write(f"📧 {email}")
                 
-                # Create DataFrame for export
+                # Create rows for export
                 if categorize_results and categories:
-                    # Create a DataFrame with categories
+                    # Create rows with categories
                     export_data = []
                     for category, emails in categories.items():
                         for email in emails:
                             export_data.append({"Email": email, "Category": category.title()})
-                    df = pd.DataFrame(export_data)
                 else:
-                    df = pd.DataFrame({"Email": email_list})
+                    export_data = [{"Email": email} for email in email_list]
                 
                 # Export options
                 st.subheader("📤 Export Options")
                 col1, col2, col3 = st.columns(3)
                 
                 with col1:
-                    csv_data = df.to_csv(index=False).encode('utf-8')
+                    csv_data = _rows_to_csv(export_data)
                     st.download_button(
                         "⬇️ Download CSV",
                         data=csv_data,
@@ -455,17 +1159,17 @@ def main():
                 
                 # Statistics
                 with st.expander("📈 Extraction Statistics"):
-                    domain = urlparse(url).netloc
-                    domain_emails = [e for e in email_list if domain.replace('www.', '') in e]
-                    external_emails = [e for e in email_list if domain.replace('www.', '') not in e]
+                    domain = urlparse(url).netloc.replace('www.', '')
+                    # One pass; only the counts are shown
+                    domain_count = sum(domain in e for e in email_list)
                     
                     col1, col2, col3 = st.columns(3)
                     with col1:
                         st.metric("Total Emails", len(email_list))
                     with col2:
-                        st.metric("Domain Emails", len(domain_emails))
+                        st.metric("Domain Emails", domain_count)
                     with col3:
-                        st.metric("External Emails", len(external_emails))
+                        st.metric("External Emails", len(email_list) - domain_count)
             
             else:
                 st.warning("🔍 No email addresses found on this page.")
@@ -481,6 +1185,35 @@ def main():
             progress_bar.empty()
             status_text.empty()
     
+    # Bulk extraction (static HTML only, fetched concurrently)
+    with st.expander("📋 Bulk Extraction"):
+        bulk_urls = st.text_area(
+            "Website URLs (one per line)",
+            placeholder="https://example.com\nhttps://example.org",
+            help="Pages are fetched concurrently with the fast requests method"
+        )
+        bulk_button = st.button("🚀 Extract From All", use_container_width=True)
+        
+        if bulk_button and bulk_urls:
+            urls = list(dict.fromkeys(u.strip() for u in bulk_urls.splitlines() if u.strip()))
+            invalid_urls = [u for u in urls if not validators.url(u)]
+            if invalid_urls:
+                st.error(f"❌ Invalid URLs: {', '.join(invalid_urls)}")
+            else:
+                with st.spinner(f"Extracting from {len(urls)} URLs..."):
+                    results = asyncio.run(EmailExtractor().extract_many(urls))
+                
+                bulk_rows = [{"URL": u, "Emails": len(found), "Addresses": ", ".join(sorted(found))}
+                             for u, found in results.items()]
+                st.dataframe(bulk_rows, use_container_width=True)
+                
+                st.download_button(
+                    "⬇️ Download CSV",
+                    data=_rows_to_csv(bulk_rows),
+                    file_name=f"emails_bulk_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                    mime="text/csv"
+                )
+    
     # Footer
     st.markdown("---")
     col1, col2, col3 = st.columns(3)
@@ -0,0 +1,54 @@
+import pytest
+
+from company_lookup_app import _is_website_url, parse_markdown_table
+
+
+def test_parse_markdown_table_with_outer_pipes():
+    df = parse_markdown_table("| Name | Role |\n|---|---|\n| Jane | CEO |\n")
+    assert df.columns.tolist() == ["Name", "Role"]
+    assert df.values.tolist() == [["Jane", "CEO"]]
+
+
+def test_parse_markdown_table_without_outer_pipes():
+    df = parse_markdown_table("Name | Role\n--- | ---\nJane | CEO\nJohn | CTO\n")
+    assert df.columns.tolist() == ["Name", "Role"]
+    assert df.values.tolist() == [["Jane", "CEO"], ["John", "CTO"]]
+
+
+def test_parse_markdown_table_keeps_blank_cells():
+    df = parse_markdown_table("| Name | Email |\n|:--|--:|\n| Jane | |\n")
+    assert df.values.tolist() == [["Jane", ""]]
+
+
+def test_parse_markdown_table_ignores_surrounding_prose():
+    df = parse_markdown_table("Here is what I found:\n\n| A | B |\n|---|---|\n| 1 | 2 |\n\nSources: none\n")
+    assert df.values.tolist() == [["1", "2"]]
+
+
+def test_parse_markdown_table_needs_a_header_and_a_row():
+    assert parse_markdown_table("No table here.") is None
+
+
+@pytest.mark.parametrize("website", [
+    "https://acme.com",
+    "https://acme.com/team?page=2",
+    "https://münchen.de",
+    "https://xn--80ak6aa92e.xn--p1ai",
+    "http://192.168.1.10:8080/",
+    "http://[::1]/",
+])
+def test_is_website_url_accepts(website):
+    assert _is_website_url(website)
+
+
+@pytest.mark.parametrize("website", [
+    "https://acme.com\n",
+    "https://acme.com/team\n",
+    "http://192.168.1.10\n",
+    "https://ac\tme.com",
+    "ftp://acme.com",
+    "https://localhost",
+    "https://a..com",
+])
+def test_is_website_url_rejects(website):
+    assert not _is_website_url(website)
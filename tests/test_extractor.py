@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+import extractor
+
+
+def test_read_capped_stops_at_the_page_cap():
+    chunks = [b"x" * extractor._PAGE_READ_CHUNK] * 100
+    html = extractor._read_capped(iter(chunks))
+    assert len(html) == extractor._MAX_PAGE_BYTES
+
+
+def test_aread_capped_matches_read_capped():
+    chunks = [b"a" * 1000, b"b" * extractor._MAX_PAGE_BYTES, b"c" * 1000]
+
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    assert asyncio.run(extractor._aread_capped(stream())) == extractor._read_capped(iter(chunks))
+
+
+@pytest.mark.parametrize("local", ["müller", "françois", "ñandú"])
+def test_scan_does_not_split_non_ascii_local_parts(local):
+    html = f"<p>{local}@acme.de</p>".encode()
+    assert extractor._scan_at_tokens(html) == []
+
+
+def test_scan_finds_ascii_address_next_to_non_ascii_text():
+    html = "<p>Kontakt für Anfragen:\xa0sales@acme.de</p>".encode()
+    assert extractor._scan_at_tokens(html) == ["sales@acme.de"]
+
+
+def test_scan_treats_a_bare_less_than_as_text():
+    assert extractor._scan_at_tokens(b"<p>a < b sales@acme.de</p>") == ["sales@acme.de"]
+
+
+def test_scan_skips_addresses_in_attributes():
+    html = b'<p><img src="logo@2x.png" alt="x"> hi</p>'
+    assert extractor._scan_at_tokens(html) == []
+
+
+def test_parse_html_skips_a_script_cut_off_by_the_page_cap():
+    html = b"<p>sales@acme.de</p><script>var a = 'dev@tracker.io"
+    assert extractor.EmailExtractor()._parse_html(html) == {"sales@acme.de"}